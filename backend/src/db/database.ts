@@ -16,6 +16,9 @@ const DB_PATH = path.join(DATA_DIR, "deepgram.db");
 // Migrations directory
 const MIGRATIONS_DIR = path.resolve(__dirname, "migrations");
 
+// How often to refresh query planner statistics
+const OPTIMIZE_INTERVAL_MS = 60 * 60 * 1000;
+
 interface Migration {
   version: number;
   name: string;
@@ -30,6 +33,8 @@ interface AppliedMigration {
 
 class DatabaseManager {
   private db: Database.Database | null = null;
+  private statements: Map<string, Database.Statement> = new Map();
+  private optimizeIntervalId: NodeJS.Timeout | null = null;
 
   /**
    * Get the database connection (lazy initialization)
@@ -51,10 +56,39 @@ class DatabaseManager {
 
       // Set busy timeout to handle concurrent access
       this.db.pragma("busy_timeout = 30000");
+
+      // Under WAL, NORMAL only fsyncs at checkpoints and is still crash-safe
+      this.db.pragma("synchronous = NORMAL");
+
+      // Keep temp tables/indices in memory and read pages via mmap (256MB)
+      this.db.pragma("temp_store = MEMORY");
+      this.db.pragma("mmap_size = 268435456");
     }
     return this.db;
   }
 
+  /**
+   * Get a prepared statement for the given SQL, compiling it only on first use.
+   * Statements are cached for the lifetime of the connection, so hot queue
+   * queries (claim, heartbeat, complete) skip SQLite's parse/plan step.
+   */
+  prepare(sql: string): Database.Statement {
+    let stmt = this.statements.get(sql);
+    if (!stmt) {
+      stmt = this.getConnection().prepare(sql);
+      this.statements.set(sql, stmt);
+    }
+    return stmt;
+  }
+
+  /**
+   * Run fn inside a single transaction (one commit for all of its writes).
+   * Rolls back and rethrows if fn throws; nested calls become savepoints.
+   */
+  transaction<T>(fn: () => T): T {
+    return this.getConnection().transaction(fn)();
+  }
+
   /**
    * Initialize the database and run pending migrations
    */
@@ -72,6 +106,22 @@ class DatabaseManager {
 
     // Run pending migrations
     this.runMigrations();
+
+    // PRAGMA optimize only analyzes tables this connection has queried, so it
+    // runs periodically and on close rather than at startup
+    if (!this.optimizeIntervalId) {
+      this.optimizeIntervalId = setInterval(() => this.optimize(), OPTIMIZE_INTERVAL_MS);
+      this.optimizeIntervalId.unref();
+    }
+  }
+
+  /**
+   * Refresh query planner statistics for the tables queried so far
+   */
+  optimize(): void {
+    if (this.db) {
+      this.db.pragma("optimize");
+    }
   }
 
   /**
@@ -188,7 +238,13 @@ class DatabaseManager {
    * Close the database connection
    */
   close(): void {
+    if (this.optimizeIntervalId) {
+      clearInterval(this.optimizeIntervalId);
+      this.optimizeIntervalId = null;
+    }
+    this.statements.clear();
     if (this.db) {
+      this.optimize();
       this.db.close();
       this.db = null;
     }
@@ -0,0 +1,10 @@
+-- Migration 010: Index the pending-job claim query
+--
+-- claimNextJob looks up the oldest pending job for a provider:
+--   WHERE status = 'pending' AND provider = ? ORDER BY created_at LIMIT 1
+-- idx_jobs_status alone still needs a sort over every pending row.
+-- This partial index only holds pending jobs, so it stays small while
+-- completed history grows, and returns them already in claim order.
+CREATE INDEX IF NOT EXISTS idx_jobs_pending_claim
+  ON jobs(provider, created_at)
+  WHERE status = 'pending';
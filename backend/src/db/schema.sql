@@ -64,6 +64,11 @@ CREATE INDEX IF NOT EXISTS idx_jobs_stuck_detection
   ON jobs(status, last_heartbeat)
   WHERE status = 'processing';
 
+-- Index for claiming the oldest pending job per provider
+CREATE INDEX IF NOT EXISTS idx_jobs_pending_claim
+  ON jobs(provider, created_at)
+  WHERE status = 'pending';
+
 --------------------------------------------------------------------------------
 -- AUDIO SUBMISSIONS TABLE
 -- Stores uploaded audio files and their processing results.
@@ -69,13 +69,14 @@ class DeepgramService implements InferenceProvider {
 
     const startTime = Date.now();
 
-    // Read file
-    const fileBuffer = fs.readFileSync(audioFilePath);
-
     // Determine content type from extension
     const ext = path.extname(audioFilePath).toLowerCase();
     const contentType = AUDIO_CONTENT_TYPE_MAP[ext] || "audio/wav";
 
+    // File-backed Blob: fetch streams it from disk with a known Content-Length
+    // instead of buffering the whole recording in memory
+    const audioBlob = await fs.openAsBlob(audioFilePath, { type: contentType });
+
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), this.config.timeoutMs);
 
@@ -95,7 +96,7 @@ class DeepgramService implements InferenceProvider {
             Authorization: `Token ${this.config.apiKey}`,
             "Content-Type": contentType,
           },
-          body: fileBuffer,
+          body: audioBlob,
           signal: controller.signal,
         }
       );
@@ -105,7 +106,10 @@ class DeepgramService implements InferenceProvider {
         throw new Error(`Deepgram transcription failed: ${response.status} - ${error}`);
       }
 
-      const rawResponse = await response.json();
+      // Keep the body so the (potentially multi-MB) response is stored
+      // without being re-serialized
+      const rawResponseJson = await response.text();
+      const rawResponse: unknown = JSON.parse(rawResponseJson);
 
       // Extract transcript from Deepgram response
       interface DeepgramTranscriptionResponse {
@@ -138,6 +142,7 @@ class DeepgramService implements InferenceProvider {
         model: modelName,
         processingTimeMs: Date.now() - startTime,
         rawResponse,
+        rawResponseJson,
       };
     } finally {
       clearTimeout(timeoutId);
@@ -402,6 +407,8 @@ class DeepgramService implements InferenceProvider {
           },
           signal: controller.signal,
         });
+        // Drain the body so undici can return the keep-alive socket to its pool
+        await response.arrayBuffer();
         return response.ok;
       } finally {
         clearTimeout(timeoutId);
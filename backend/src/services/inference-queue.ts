@@ -30,6 +30,8 @@ import {
   JobType,
   JobStatus,
   QueueStatus,
+  JobAffinity,
+  ClaimJobOptions,
   CreateTranscribeJobParams,
   CreateSummarizeJobParams,
 } from "./job-service.js";
@@ -60,6 +62,8 @@ export type {
   JobType,
   JobStatus,
   QueueStatus,
+  JobAffinity,
+  ClaimJobOptions,
   CreateTranscribeJobParams,
   CreateSummarizeJobParams,
   StreamSession,
@@ -119,6 +123,10 @@ class InferenceQueueService {
     database.close();
   }
 
+  transaction<T>(fn: () => T): T {
+    return database.transaction(fn);
+  }
+
   // ===========================================================================
   // Submission Methods (delegated to SubmissionService)
   // ===========================================================================
@@ -215,8 +223,12 @@ class InferenceQueueService {
     return jobService.getQueueStatus();
   }
 
-  claimNextJob(): Job | null {
-    return jobService.claimNextJob();
+  onJobCreated(listener: () => void): () => void {
+    return jobService.onJobCreated(listener);
+  }
+
+  claimNextJob(options?: ClaimJobOptions): Job | null {
+    return jobService.claimNextJob(options);
   }
 
   completeJob(
@@ -225,9 +237,18 @@ class InferenceQueueService {
     modelUsed: string,
     processingTimeMs: number,
     confidence?: number,
-    rawResponse?: unknown
+    rawResponse?: unknown,
+    rawResponseJson?: string
   ): void {
-    jobService.completeJob(jobId, outputText, modelUsed, processingTimeMs, confidence, rawResponse);
+    jobService.completeJob(
+      jobId,
+      outputText,
+      modelUsed,
+      processingTimeMs,
+      confidence,
+      rawResponse,
+      rawResponseJson
+    );
   }
 
   failJob(jobId: number, errorMessage: string): void {
@@ -345,8 +366,6 @@ class InferenceQueueService {
   // ===========================================================================
 
   createAnalyzeChunkJob(params: CreateAnalyzeChunkJobParams): number {
-    const db = database.getConnection();
-
     const chunk = streamService.getStreamChunk(params.chunkId);
     if (!chunk) {
       throw new Error(`Chunk ${params.chunkId} not found`);
@@ -381,7 +400,7 @@ class InferenceQueueService {
       sessionId: params.sessionId,
     };
 
-    const stmt = db.prepare(`
+    const stmt = database.prepare(`
       INSERT INTO jobs (job_type, input_text, metadata, provider)
       VALUES ('analyze_chunk', ?, ?, ?)
     `);
@@ -394,6 +413,7 @@ class InferenceQueueService {
 
     const jobId = result.lastInsertRowid as number;
     streamService.setChunkAnalysisJob(params.chunkId, jobId);
+    jobService.notifyJobCreated();
 
     return jobId;
   }
@@ -403,19 +423,17 @@ class InferenceQueueService {
   // ===========================================================================
 
   getSubmissionWithJobs(submissionId: string): SubmissionWithJobs | null {
-    const db = database.getConnection();
-
     const submission = submissionService.getSubmission(submissionId);
     if (!submission) return null;
 
-    const transcriptJob = db.prepare(`
+    const transcriptJob = database.prepare(`
       SELECT * FROM jobs
       WHERE audio_file_id = ? AND job_type = 'transcribe'
       ORDER BY created_at DESC
       LIMIT 1
     `).get(submissionId) as Job | undefined;
 
-    const summarizeJob = db.prepare(`
+    const summarizeJob = database.prepare(`
       SELECT * FROM jobs
       WHERE audio_file_id = ? AND job_type = 'summarize'
       ORDER BY created_at DESC
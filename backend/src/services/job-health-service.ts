@@ -17,17 +17,15 @@ export interface JobWithHeartbeat extends Job {
 }
 
 export class JobHealthService {
-  private getDb(): Database.Database {
-    return database.getConnection();
+  private prepare(sql: string): Database.Statement {
+    return database.prepare(sql);
   }
 
   /**
    * Update job heartbeat - called when job shows progress
    */
   updateJobHeartbeat(jobId: number, heartbeatCount: number): void {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       UPDATE jobs
       SET last_heartbeat = datetime('now'),
           heartbeat_count = ?
@@ -41,17 +39,14 @@ export class JobHealthService {
    * Mark that the model was verified as loaded before job started
    */
   markModelVerified(jobId: number): void {
-    const db = this.getDb();
-    db.prepare("UPDATE jobs SET model_verified = 1 WHERE id = ?").run(jobId);
+    this.prepare("UPDATE jobs SET model_verified = 1 WHERE id = ?").run(jobId);
   }
 
   /**
    * Find jobs that are stuck (processing but no heartbeat within timeout)
    */
   findStuckJobs(): Job[] {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       SELECT * FROM jobs
       WHERE status = 'processing'
         AND (
@@ -72,13 +67,11 @@ export class JobHealthService {
    * Recover a stuck job by marking it as failed
    */
   recoverStuckJob(jobId: number, reason: string): void {
-    const db = this.getDb();
-
-    const job = db.prepare("SELECT * FROM jobs WHERE id = ?").get(jobId) as Job | null;
+    const job = this.prepare("SELECT * FROM jobs WHERE id = ?").get(jobId) as Job | null;
     if (!job) return;
 
     // Mark job as failed
-    db.prepare(`
+    this.prepare(`
       UPDATE jobs
       SET status = 'failed',
           error_message = ?,
@@ -100,8 +93,7 @@ export class JobHealthService {
    * Get job with heartbeat info for monitoring
    */
   getJobWithHeartbeat(jobId: number): JobWithHeartbeat | null {
-    const db = this.getDb();
-    const stmt = db.prepare("SELECT * FROM jobs WHERE id = ?");
+    const stmt = this.prepare("SELECT * FROM jobs WHERE id = ?");
     return stmt.get(jobId) as JobWithHeartbeat | null;
   }
 }
@@ -2,12 +2,16 @@
  * Job Processor Service
  *
  * Background job processor that runs embedded in the Express server.
- * Polls the SQLite queue and processes jobs sequentially (one at a time).
+ * Wakes as soon as a job is created (the API shares this process) and also
+ * polls the SQLite queue as a safety net.
  *
  * Features:
- * - Single-job guarantee via mutex (GPU can only handle one model at a time)
+ * - Single local job at a time via mutex (GPU can only handle one model at a time)
+ * - Concurrent cloud jobs (Deepgram calls are I/O-bound and don't touch the GPU)
  * - Atomic job claiming via SQLite
  * - Auto-chain: transcribe job -> summarize job
+ * - Optional model affinity: when LocalAI runs a single active backend, drains
+ *   same-model local jobs in batches to avoid model swaps (off by default)
  * - Graceful shutdown (finishes current job before stopping)
  * - Multi-provider support via provider factory
  * - Model availability checking before job starts
@@ -16,9 +20,9 @@
  */
 
 import { Provider } from "../types/index.js";
-import { inferenceQueue, Job, SubmissionStatus } from "./inference-queue.js";
+import { inferenceQueue, Job, JobAffinity, SubmissionStatus } from "./inference-queue.js";
 import { getProvider } from "./provider-factory.js";
-import { LocalAIService } from "./localai.js";
+import { LocalAIService, localAI } from "./localai.js";
 import { jobEventHub } from "./job-event-hub.js";
 import { deepgram } from "./deepgram.js";
 import { streamHub } from "./stream-hub.js";
@@ -28,6 +32,7 @@ export interface ProcessorStatus {
   isProcessing: boolean;
   currentJobId: number | null;
   currentJobType: string | null;
+  activeCloudJobIds: number[];
 }
 
 class JobProcessorService {
@@ -38,7 +43,16 @@ class JobProcessorService {
   private shutdownRequested = false;
   private pollIntervalMs = 2000;
   private stuckCheckIntervalMs = 30000; // Check for stuck jobs every 30 seconds
+  // Only worth breaking FIFO order when LocalAI unloads one model to load another
+  private modelAffinity = process.env.LOCALAI_SINGLE_ACTIVE_BACKEND === "true";
+  private maxAffinityBatch = 8; // Max consecutive same-model jobs before falling back to FIFO
+  private lastAffinity: JobAffinity | null = null;
+  private affinityBatchCount = 0;
+  private maxCloudConcurrency = 8; // Max Deepgram jobs in flight at once
+  private activeCloudJobs: Set<number> = new Set();
   private pollTimeoutId: NodeJS.Timeout | null = null;
+  private wakeScheduled = false;
+  private unsubscribeJobCreated: (() => void) | null = null;
   private stuckCheckTimeoutId: NodeJS.Timeout | null = null;
 
   /**
@@ -57,9 +71,15 @@ class JobProcessorService {
 
     this.isRunning = true;
     this.shutdownRequested = false;
+    this.unsubscribeJobCreated = inferenceQueue.onJobCreated(() => this.wake());
     this.poll();
     this.checkStuckJobs(); // Start stuck job detection loop
 
+    // Load Whisper in the background so the first local job doesn't pay for it
+    if (process.env.LOCALAI_WARMUP !== "false") {
+      localAI.warmup();
+    }
+
     console.log("[JobProcessor] Started - polling every", this.pollIntervalMs, "ms");
     console.log("[JobProcessor] Stuck job detection every", this.stuckCheckIntervalMs, "ms");
   }
@@ -76,6 +96,12 @@ class JobProcessorService {
     console.log("[JobProcessor] Shutdown requested...");
     this.shutdownRequested = true;
 
+    // Stop listening for new jobs
+    if (this.unsubscribeJobCreated) {
+      this.unsubscribeJobCreated();
+      this.unsubscribeJobCreated = null;
+    }
+
     // Clear polling timeout
     if (this.pollTimeoutId) {
       clearTimeout(this.pollTimeoutId);
@@ -88,9 +114,9 @@ class JobProcessorService {
       this.stuckCheckTimeoutId = null;
     }
 
-    // Wait for current job to finish
-    while (this.isProcessing) {
-      console.log("[JobProcessor] Waiting for current job to complete...");
+    // Wait for in-flight jobs to finish
+    while (this.isProcessing || this.activeCloudJobs.size > 0) {
+      console.log("[JobProcessor] Waiting for current job(s) to complete...");
       await new Promise((resolve) => setTimeout(resolve, 500));
     }
 
@@ -107,6 +133,7 @@ class JobProcessorService {
       isProcessing: this.isProcessing,
       currentJobId: this.currentJobId,
       currentJobType: this.currentJobType,
+      activeCloudJobIds: [...this.activeCloudJobs],
     };
   }
 
@@ -118,42 +145,121 @@ class JobProcessorService {
       return;
     }
 
-    // Don't poll if already processing
-    if (!this.isProcessing) {
-      this.tryProcessNextJob();
-    }
+    this.processAvailableJobs();
 
     // Schedule next poll
     this.pollTimeoutId = setTimeout(() => this.poll(), this.pollIntervalMs);
   }
 
   /**
-   * Try to claim and process the next job
+   * Wake the processor after a job is created or a lane frees up.
+   * Deferred with setImmediate so the creator finishes its own writes and
+   * events first; multiple creates in the same tick coalesce into one claim.
+   */
+  private wake(): void {
+    if (this.shutdownRequested || this.wakeScheduled) {
+      return;
+    }
+
+    this.wakeScheduled = true;
+    setImmediate(() => {
+      this.wakeScheduled = false;
+      if (!this.shutdownRequested) {
+        this.processAvailableJobs();
+      }
+    });
+  }
+
+  /**
+   * Claim whatever each lane has capacity for: cloud jobs up to the
+   * concurrency limit, plus one local job if the GPU lane is idle
    */
-  private async tryProcessNextJob(): Promise<void> {
+  private processAvailableJobs(): void {
+    this.fillCloudSlots();
+    this.tryProcessNextLocalJob();
+  }
+
+  /**
+   * Claim pending Deepgram jobs until the concurrency limit is reached.
+   * Each runs independently; the slot is freed when it settles.
+   */
+  private fillCloudSlots(): void {
+    while (this.activeCloudJobs.size < this.maxCloudConcurrency) {
+      const job = inferenceQueue.claimNextJob({ provider: Provider.DEEPGRAM });
+      if (!job) {
+        return;
+      }
+
+      this.activeCloudJobs.add(job.id);
+      this.executeJob(job)
+        .catch((error) => {
+          // Not awaited by anyone; an escaped rejection would crash the process
+          console.error(`[JobProcessor] Unhandled error in cloud job ${job.id}:`, error);
+        })
+        .finally(() => {
+          this.activeCloudJobs.delete(job.id);
+          this.wake();
+        });
+    }
+  }
+
+  /**
+   * Try to claim and process the next local (GPU) job
+   */
+  private async tryProcessNextLocalJob(): Promise<void> {
     // Double-check mutex
     if (this.isProcessing) {
       return;
     }
 
-    // Try to claim next job atomically
-    const job = inferenceQueue.claimNextJob();
+    // Try to claim next job atomically. With a single active backend, prefer
+    // the model LocalAI already has loaded; otherwise claim in FIFO order.
+    const affinity =
+      this.modelAffinity && this.affinityBatchCount < this.maxAffinityBatch
+        ? this.lastAffinity
+        : null;
+    const job = inferenceQueue.claimNextJob({
+      provider: Provider.LOCAL,
+      affinity: affinity ?? undefined,
+    });
 
     if (!job) {
       // No pending jobs
       return;
     }
 
-    console.log(`[JobProcessor] Claimed job ${job.id} (${job.job_type}, provider: ${job.provider})`);
-
-    // Emit job claimed event
-    jobEventHub.emitJobClaimed(job.id, job.job_type, job.provider);
+    this.trackAffinity(job, affinity);
 
     // Set processing state
     this.isProcessing = true;
     this.currentJobId = job.id;
     this.currentJobType = job.job_type;
 
+    try {
+      await this.executeJob(job);
+    } catch (error) {
+      // processAvailableJobs doesn't await this lane either
+      console.error(`[JobProcessor] Unhandled error in local job ${job.id}:`, error);
+    } finally {
+      // Clear processing state
+      this.isProcessing = false;
+      this.currentJobId = null;
+      this.currentJobType = null;
+    }
+
+    // Drain the queue back-to-back instead of idling until the next poll
+    this.wake();
+  }
+
+  /**
+   * Run a claimed job to completion, recording failure if it throws
+   */
+  private async executeJob(job: Job): Promise<void> {
+    console.log(`[JobProcessor] Claimed job ${job.id} (${job.job_type}, provider: ${job.provider})`);
+
+    // Emit job claimed event
+    jobEventHub.emitJobClaimed(job.id, job.job_type, job.provider);
+
     try {
       // Update submission status if linked (not for analyze_chunk jobs)
       if (job.audio_file_id && job.job_type !== "analyze_chunk") {
@@ -175,29 +281,37 @@ class JobProcessorService {
         error instanceof Error ? error.message : String(error);
       console.error(`[JobProcessor] Job ${job.id} failed:`, errorMessage);
 
-      // Mark job as failed
-      inferenceQueue.failJob(job.id, errorMessage);
+      // Mark job and linked submission as failed in one commit
+      inferenceQueue.transaction(() => {
+        inferenceQueue.failJob(job.id, errorMessage);
+        if (job.audio_file_id) {
+          inferenceQueue.updateSubmissionStatus(
+            job.audio_file_id,
+            "failed",
+            errorMessage
+          );
+        }
+      });
 
       // Emit job failed event
       jobEventHub.emitJobFailed(job.id, errorMessage);
       jobEventHub.emitQueueStatus();
-
-      // Update submission status if linked
-      if (job.audio_file_id) {
-        inferenceQueue.updateSubmissionStatus(
-          job.audio_file_id,
-          "failed",
-          errorMessage
-        );
-      }
-    } finally {
-      // Clear processing state
-      this.isProcessing = false;
-      this.currentJobId = null;
-      this.currentJobType = null;
     }
   }
 
+  /**
+   * Record the claimed local job's model so the next claim can stay on it
+   */
+  private trackAffinity(job: Job, affinity: JobAffinity | null): void {
+    const sameModel =
+      affinity !== null &&
+      affinity.jobType === job.job_type &&
+      affinity.provider === job.provider;
+
+    this.affinityBatchCount = sameModel ? this.affinityBatchCount + 1 : 1;
+    this.lastAffinity = { jobType: job.job_type, provider: job.provider };
+  }
+
   /**
    * Process a transcription job
    */
@@ -213,7 +327,7 @@ class JobProcessorService {
     // Verify model is loaded for LocalAI before starting
     if (job.provider === Provider.LOCAL && provider instanceof LocalAIService) {
       const whisperModel = provider.getConfig().whisperModel;
-      const modelLoaded = await provider.isModelLoaded(whisperModel);
+      const modelLoaded = await provider.ensureModelLoaded(whisperModel);
 
       if (!modelLoaded) {
         throw new Error(
@@ -235,43 +349,52 @@ class JobProcessorService {
       `[JobProcessor] Transcription complete (${result.processingTimeMs}ms, model: ${result.model})`
     );
 
-    // Mark job as completed with raw response
-    inferenceQueue.completeJob(
-      job.id,
-      result.text,
-      result.model,
-      result.processingTimeMs,
-      result.confidence,
-      result.rawResponse
-    );
+    // Complete the job and advance its submission in a single commit:
+    // either chain a summarize job or mark the submission completed
+    const summarizeJobId = inferenceQueue.transaction(() => {
+      inferenceQueue.completeJob(
+        job.id,
+        result.text,
+        result.model,
+        result.processingTimeMs,
+        result.confidence,
+        result.rawResponse,
+        result.rawResponseJson
+      );
 
-    // Emit job completed event
-    jobEventHub.emitJobCompleted(job.id, result.processingTimeMs, result.confidence ?? null);
-    jobEventHub.emitQueueStatus();
+      if (!job.audio_file_id) {
+        return null;
+      }
 
-    // Handle submission status and auto-summarize
-    if (job.audio_file_id) {
-      // Check if auto-summarize is requested
-      const metadata = job.metadata ? JSON.parse(job.metadata) : {};
-      if (metadata.autoSummarize && result.text.trim()) {
+      // Check if auto-summarize is requested. Metadata is written with
+      // JSON.stringify (no whitespace), so the flag can be matched without parsing.
+      const autoSummarize = job.metadata?.includes('"autoSummarize":true') ?? false;
+      if (autoSummarize && result.text.trim()) {
         console.log(`[JobProcessor] Auto-creating summarize job for submission ${job.audio_file_id}`);
 
         // Create summarize job with the same provider
-        const summarizeJobId = inferenceQueue.createSummarizeJob({
+        return inferenceQueue.createSummarizeJob({
           text: result.text,
           audioFileId: job.audio_file_id,
           provider: job.provider as Provider,
         });
+      }
 
-        // Emit job created event for the summarize job
-        const summarizeJob = inferenceQueue.getJob(summarizeJobId);
-        if (summarizeJob) {
-          jobEventHub.emitJobCreated(summarizeJob);
-          jobEventHub.emitQueueStatus();
-        }
-      } else {
-        // No auto-summarize, mark submission as completed
-        inferenceQueue.updateSubmissionStatus(job.audio_file_id, "completed");
+      // No auto-summarize, mark submission as completed
+      inferenceQueue.updateSubmissionStatus(job.audio_file_id, "completed");
+      return null;
+    });
+
+    // Emit job completed event
+    jobEventHub.emitJobCompleted(job.id, result.processingTimeMs, result.confidence ?? null);
+    jobEventHub.emitQueueStatus();
+
+    // Emit job created event for the summarize job
+    if (summarizeJobId !== null) {
+      const summarizeJob = inferenceQueue.getJob(summarizeJobId);
+      if (summarizeJob) {
+        jobEventHub.emitJobCreated(summarizeJob);
+        jobEventHub.emitQueueStatus();
       }
     }
   }
@@ -306,24 +429,24 @@ class JobProcessorService {
         `sentiment: ${analysisResult.sentiment?.sentiment || "none"}`
       );
 
-      // Mark job as completed with analysis results
-      inferenceQueue.completeJob(
-        job.id,
-        analysisResult.summary,
-        "deepgram-text-intelligence",
-        analysisResult.processingTimeMs,
-        undefined,
-        analysisResult.rawResponse
-      );
+      // Mark job and submission as completed in one commit (results are in the job)
+      inferenceQueue.transaction(() => {
+        inferenceQueue.completeJob(
+          job.id,
+          analysisResult.summary,
+          "deepgram-text-intelligence",
+          analysisResult.processingTimeMs,
+          undefined,
+          analysisResult.rawResponse
+        );
+        if (job.audio_file_id) {
+          inferenceQueue.updateSubmissionStatus(job.audio_file_id, "completed");
+        }
+      });
 
       // Emit job completed event
       jobEventHub.emitJobCompleted(job.id, analysisResult.processingTimeMs, null);
       jobEventHub.emitQueueStatus();
-
-      // Mark submission as completed (results are in the job)
-      if (job.audio_file_id) {
-        inferenceQueue.updateSubmissionStatus(job.audio_file_id, "completed");
-      }
       return;
     }
 
@@ -331,7 +454,7 @@ class JobProcessorService {
     let result;
     if (job.provider === Provider.LOCAL && provider instanceof LocalAIService) {
       // Verify model is loaded before starting
-      const modelLoaded = await provider.isModelLoaded(provider.getConfig().llmModel);
+      const modelLoaded = await provider.ensureModelLoaded(provider.getConfig().llmModel);
       if (!modelLoaded) {
         throw new Error(
           `Model '${provider.getConfig().llmModel}' is not loaded. ` +
@@ -374,23 +497,24 @@ class JobProcessorService {
       sentiment: result.sentiment || null,
     };
 
-    inferenceQueue.completeJob(
-      job.id,
-      result.text,
-      result.model,
-      result.processingTimeMs,
-      result.confidence,
-      rawResponseWithAnalysis
-    );
+    // Mark job and submission as completed in one commit (results are in the job)
+    inferenceQueue.transaction(() => {
+      inferenceQueue.completeJob(
+        job.id,
+        result.text,
+        result.model,
+        result.processingTimeMs,
+        result.confidence,
+        rawResponseWithAnalysis
+      );
+      if (job.audio_file_id) {
+        inferenceQueue.updateSubmissionStatus(job.audio_file_id, "completed");
+      }
+    });
 
     // Emit job completed event
     jobEventHub.emitJobCompleted(job.id, result.processingTimeMs, result.confidence ?? null);
     jobEventHub.emitQueueStatus();
-
-    // Mark submission as completed (results are in the job)
-    if (job.audio_file_id) {
-      inferenceQueue.updateSubmissionStatus(job.audio_file_id, "completed");
-    }
   }
 
   /**
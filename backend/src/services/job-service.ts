@@ -42,6 +42,20 @@ export interface QueueStatus {
   avgProcessingTimeMs: number | null;
 }
 
+/**
+ * Job type + provider pair the processor would like to claim next.
+ * Used to keep consecutive jobs on the same model.
+ */
+export interface JobAffinity {
+  jobType: JobType;
+  provider: Provider;
+}
+
+export interface ClaimJobOptions {
+  provider?: Provider;
+  affinity?: JobAffinity;
+}
+
 export interface CreateTranscribeJobParams {
   audioFilePath: string;
   audioFileId?: string;
@@ -57,17 +71,37 @@ export interface CreateSummarizeJobParams {
 }
 
 export class JobService {
-  private getDb(): Database.Database {
-    return database.getConnection();
+  private jobCreatedListeners: Set<() => void> = new Set();
+
+  private prepare(sql: string): Database.Statement {
+    return database.prepare(sql);
+  }
+
+  /**
+   * Register a callback fired whenever a job is inserted.
+   * Returns a function that removes the listener.
+   */
+  onJobCreated(listener: () => void): () => void {
+    this.jobCreatedListeners.add(listener);
+    return () => {
+      this.jobCreatedListeners.delete(listener);
+    };
+  }
+
+  /**
+   * Notify listeners that a new pending job exists
+   */
+  notifyJobCreated(): void {
+    for (const listener of this.jobCreatedListeners) {
+      listener();
+    }
   }
 
   /**
    * Create a transcription job
    */
   createTranscribeJob(params: CreateTranscribeJobParams): number {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO jobs (job_type, input_file_path, audio_file_id, metadata, provider)
       VALUES ('transcribe', ?, ?, ?, ?)
     `);
@@ -79,6 +113,7 @@ export class JobService {
       params.provider || Provider.LOCAL
     );
 
+    this.notifyJobCreated();
     return result.lastInsertRowid as number;
   }
 
@@ -86,9 +121,7 @@ export class JobService {
    * Create a summarization job
    */
   createSummarizeJob(params: CreateSummarizeJobParams): number {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO jobs (job_type, input_text, audio_file_id, metadata, provider)
       VALUES ('summarize', ?, ?, ?, ?)
     `);
@@ -100,6 +133,7 @@ export class JobService {
       params.provider || Provider.LOCAL
     );
 
+    this.notifyJobCreated();
     return result.lastInsertRowid as number;
   }
 
@@ -107,8 +141,7 @@ export class JobService {
    * Get a job by ID
    */
   getJob(jobId: number): Job | null {
-    const db = this.getDb();
-    const stmt = db.prepare("SELECT * FROM jobs WHERE id = ?");
+    const stmt = this.prepare("SELECT * FROM jobs WHERE id = ?");
     return stmt.get(jobId) as Job | null;
   }
 
@@ -116,8 +149,7 @@ export class JobService {
    * Get jobs for an audio file
    */
   getJobsForSubmission(audioFileId: string): Job[] {
-    const db = this.getDb();
-    const stmt = db.prepare(
+    const stmt = this.prepare(
       "SELECT * FROM jobs WHERE audio_file_id = ? ORDER BY created_at DESC"
     );
     return stmt.all(audioFileId) as Job[];
@@ -127,8 +159,7 @@ export class JobService {
    * Get recent jobs
    */
   getRecentJobs(limit: number = 20): Job[] {
-    const db = this.getDb();
-    const stmt = db.prepare(
+    const stmt = this.prepare(
       "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?"
     );
     return stmt.all(limit) as Job[];
@@ -138,8 +169,7 @@ export class JobService {
    * Get pending jobs count
    */
   getPendingCount(): number {
-    const db = this.getDb();
-    const stmt = db.prepare(
+    const stmt = this.prepare(
       "SELECT COUNT(*) as count FROM jobs WHERE status = 'pending'"
     );
     const result = stmt.get() as { count: number };
@@ -150,66 +180,81 @@ export class JobService {
    * Get queue status
    */
   getQueueStatus(): QueueStatus {
-    const db = this.getDb();
-
-    const statusStmt = db.prepare(`
-      SELECT status, COUNT(*) as count
+    // Single pass over jobs with conditional aggregates
+    const stmt = this.prepare(`
+      SELECT
+        COUNT(*) as total,
+        COALESCE(SUM(status = 'pending'), 0) as pending,
+        COALESCE(SUM(status = 'processing'), 0) as processing,
+        COALESCE(SUM(status = 'completed'), 0) as completed,
+        COALESCE(SUM(status = 'failed'), 0) as failed,
+        AVG(CASE WHEN status = 'completed' THEN processing_time_ms END) as avg_time
       FROM jobs
-      GROUP BY status
     `);
-    const statusRows = statusStmt.all() as { status: JobStatus; count: number }[];
-
-    const statusCounts: Record<string, number> = {};
-    for (const row of statusRows) {
-      statusCounts[row.status] = row.count;
-    }
-
-    const totalStmt = db.prepare("SELECT COUNT(*) as total FROM jobs");
-    const totalResult = totalStmt.get() as { total: number };
-
-    const avgStmt = db.prepare(`
-      SELECT AVG(processing_time_ms) as avg_time
-      FROM jobs
-      WHERE status = 'completed' AND processing_time_ms IS NOT NULL
-    `);
-    const avgResult = avgStmt.get() as { avg_time: number | null };
+    const result = stmt.get() as {
+      total: number;
+      pending: number;
+      processing: number;
+      completed: number;
+      failed: number;
+      avg_time: number | null;
+    };
 
     return {
-      totalJobs: totalResult.total,
-      pending: statusCounts.pending || 0,
-      processing: statusCounts.processing || 0,
-      completed: statusCounts.completed || 0,
-      failed: statusCounts.failed || 0,
-      avgProcessingTimeMs: avgResult.avg_time
-        ? Math.round(avgResult.avg_time)
+      totalJobs: result.total,
+      pending: result.pending,
+      processing: result.processing,
+      completed: result.completed,
+      failed: result.failed,
+      avgProcessingTimeMs: result.avg_time
+        ? Math.round(result.avg_time)
         : null,
     };
   }
 
   /**
    * Claim the next pending job atomically
+   *
+   * A provider restricts the claim to that provider's jobs. With an affinity,
+   * the oldest pending job matching it is claimed ahead of older jobs of other
+   * types, otherwise plain FIFO order is used.
    */
-  claimNextJob(): Job | null {
-    const db = this.getDb();
+  claimNextJob(options: ClaimJobOptions = {}): Job | null {
+    const conditions = ["status = 'pending'"];
+    const params: string[] = [];
+
+    if (options.provider) {
+      conditions.push("provider = ?");
+      params.push(options.provider);
+    }
 
-    const stmt = db.prepare(`
+    let orderBy = "created_at ASC";
+    if (options.affinity) {
+      orderBy = "(job_type = ? AND provider = ?) DESC, created_at ASC";
+      params.push(options.affinity.jobType, options.affinity.provider);
+    }
+
+    const stmt = this.prepare(`
       UPDATE jobs
       SET status = 'processing', started_at = datetime('now')
       WHERE id = (
         SELECT id FROM jobs
-        WHERE status = 'pending'
-        ORDER BY created_at ASC
+        WHERE ${conditions.join(" AND ")}
+        ORDER BY ${orderBy}
         LIMIT 1
       )
       RETURNING *
     `);
 
-    const job = stmt.get() as Job | undefined;
+    const job = stmt.get(...params) as Job | undefined;
     return job || null;
   }
 
   /**
    * Mark a job as completed with output and raw response
+   *
+   * rawResponseJson, when given, is stored as-is instead of re-serializing
+   * rawResponse.
    */
   completeJob(
     jobId: number,
@@ -217,11 +262,10 @@ export class JobService {
     modelUsed: string,
     processingTimeMs: number,
     confidence?: number,
-    rawResponse?: unknown
+    rawResponse?: unknown,
+    rawResponseJson?: string
   ): void {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       UPDATE jobs
       SET status = 'completed',
           output_text = ?,
@@ -239,7 +283,7 @@ export class JobService {
       modelUsed,
       processingTimeMs,
       confidence ?? null,
-      rawResponse ? JSON.stringify(rawResponse) : null,
+      rawResponse ? rawResponseJson ?? JSON.stringify(rawResponse) : null,
       rawResponse ? typeof rawResponse : null,
       jobId
     );
@@ -260,9 +304,7 @@ export class JobService {
    * Mark a job as failed with error message
    */
   failJob(jobId: number, errorMessage: string): void {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       UPDATE jobs
       SET status = 'failed',
           error_message = ?,
@@ -312,8 +354,7 @@ export class JobService {
    * Delete jobs for a submission
    */
   deleteJobsForSubmission(audioFileId: string): void {
-    const db = this.getDb();
-    db.prepare("DELETE FROM jobs WHERE audio_file_id = ?").run(audioFileId);
+    this.prepare("DELETE FROM jobs WHERE audio_file_id = ?").run(audioFileId);
   }
 }
 
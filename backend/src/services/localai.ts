@@ -33,6 +33,7 @@ import {
   TEXT_ANALYSIS_USER_PROMPT,
   SUMMARIZATION_FALLBACK_PROMPT,
 } from "../constants.js";
+import { createSilentWav } from "../utils/wav.js";
 
 /**
  * Heartbeat callback for tracking job progress during streaming
@@ -42,17 +43,49 @@ export type HeartbeatCallback = (tokenCount: number, partialText: string) => voi
 export interface LocalAIConfig {
   baseUrl: string;
   whisperModel: string;
+  whisperLanguage: string; // ISO 639-1 code; empty lets Whisper auto-detect
   llmModel: string;
   timeoutMs: number;
+  modelCheckTtlMs: number;
 }
 
 const DEFAULT_CONFIG: LocalAIConfig = {
   baseUrl: process.env.LOCALAI_URL || "http://localhost:8080",
-  whisperModel: process.env.LOCALAI_WHISPER_MODEL || "whisper-1",
+  whisperModel: process.env.LOCALAI_WHISPER_MODEL || "whisper-1-q8_0",
+  whisperLanguage: process.env.LOCALAI_WHISPER_LANGUAGE || "",
   llmModel: process.env.LOCALAI_LLM_MODEL || "qwen2.5-7b",
   timeoutMs: 300000, // 5 minutes for long audio
+  modelCheckTtlMs: 60000, // Re-verify resident models at most once a minute
 };
 
+/**
+ * Tracks which models LocalAI has confirmed as loaded.
+ *
+ * LocalAI keeps models resident between requests, so once a model has been
+ * verified there is no need to query /v1/models before every job. Entries
+ * expire after the TTL and are evicted whenever an inference call fails for
+ * any reason (error status, unreachable server, timeout, stalled stream),
+ * forcing a fresh check on the next job.
+ */
+class ModelManager {
+  private verifiedAt: Map<string, number> = new Map();
+
+  constructor(private readonly ttlMs: number) {}
+
+  isVerified(modelName: string): boolean {
+    const verifiedAt = this.verifiedAt.get(modelName);
+    return verifiedAt !== undefined && Date.now() - verifiedAt < this.ttlMs;
+  }
+
+  markVerified(modelName: string): void {
+    this.verifiedAt.set(modelName, Date.now());
+  }
+
+  evict(modelName: string): void {
+    this.verifiedAt.delete(modelName);
+  }
+}
+
 // Zod schemas for validating LLM JSON output
 const TopicSchema = z.object({
   topic: z.string(),
@@ -87,12 +120,53 @@ const TextAnalysisResponseSchema = z.object({
 
 type TextAnalysisResponse = z.infer<typeof TextAnalysisResponseSchema>;
 
+/**
+ * Incrementally tracks streamed LLM output and reports when the first
+ * top-level JSON object has been closed. Braces inside strings are ignored.
+ */
+class JsonCompletionTracker {
+  private depth = 0;
+  private started = false;
+  private inString = false;
+  private escaped = false;
+
+  /**
+   * Feed the next piece of streamed text; returns true once the object closes
+   */
+  push(text: string): boolean {
+    for (const ch of text) {
+      if (this.inString) {
+        if (this.escaped) {
+          this.escaped = false;
+        } else if (ch === "\\") {
+          this.escaped = true;
+        } else if (ch === '"') {
+          this.inString = false;
+        }
+      } else if (ch === '"' && this.started) {
+        this.inString = true;
+      } else if (ch === "{") {
+        this.depth++;
+        this.started = true;
+      } else if (ch === "}" && this.started) {
+        this.depth--;
+        if (this.depth === 0) {
+          return true;
+        }
+      }
+    }
+    return false;
+  }
+}
+
 class LocalAIService implements InferenceProvider {
   public readonly name = Provider.LOCAL;
   private config: LocalAIConfig;
+  private models: ModelManager;
 
   constructor(config: Partial<LocalAIConfig> = {}) {
     this.config = { ...DEFAULT_CONFIG, ...config };
+    this.models = new ModelManager(this.config.modelCheckTtlMs);
   }
 
   /**
@@ -102,20 +176,23 @@ class LocalAIService implements InferenceProvider {
   async transcribe(audioFilePath: string): Promise<TranscriptionResult> {
     const startTime = Date.now();
 
-    // Read file and create form data
-    const fileBuffer = fs.readFileSync(audioFilePath);
     const fileName = path.basename(audioFilePath);
 
     // Determine MIME type from extension
     const ext = path.extname(audioFilePath).toLowerCase();
     const mimeType = AUDIO_CONTENT_TYPE_MAP[ext] || "audio/wav";
 
-    // Create FormData with file
+    // Create FormData with a file-backed Blob: the recording is read from
+    // disk as the multipart body is sent, instead of a blocking read up front
     const formData = new FormData();
-    const blob = new Blob([fileBuffer], { type: mimeType });
+    const blob = await fs.openAsBlob(audioFilePath, { type: mimeType });
     formData.append("file", blob, fileName);
     formData.append("model", this.config.whisperModel);
     formData.append("response_format", "json");
+    // A fixed language skips Whisper's language-detection pass
+    if (this.config.whisperLanguage) {
+      formData.append("language", this.config.whisperLanguage);
+    }
 
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), this.config.timeoutMs);
@@ -144,6 +221,58 @@ class LocalAIService implements InferenceProvider {
         processingTimeMs: Date.now() - startTime,
         rawResponse,
       };
+    } catch (error) {
+      // Any failure (error status, connection refused, timeout) means the
+      // model can no longer be assumed loaded
+      this.models.evict(this.config.whisperModel);
+      throw error;
+    } finally {
+      clearTimeout(timeoutId);
+    }
+  }
+
+  /**
+   * Warm up the Whisper model with a 1-second silent clip.
+   *
+   * LocalAI loads a model (and whisper.cpp allocates its mel/FFT buffers) on
+   * the first request that uses it. Paying that once at startup, rather than
+   * on the first user job, costs a few hundred ms amortized over the process
+   * lifetime. Failures are logged and otherwise ignored.
+   */
+  async warmup(): Promise<void> {
+    const startTime = Date.now();
+
+    const formData = new FormData();
+    const blob = new Blob([createSilentWav(1000)], { type: "audio/wav" });
+    formData.append("file", blob, "warmup.wav");
+    formData.append("model", this.config.whisperModel);
+    formData.append("response_format", "json");
+
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), this.config.timeoutMs);
+
+    try {
+      const response = await fetch(
+        `${this.config.baseUrl}/v1/audio/transcriptions`,
+        {
+          method: "POST",
+          body: formData,
+          signal: controller.signal,
+        }
+      );
+      await response.arrayBuffer();
+
+      if (!response.ok) {
+        console.warn(`[LocalAI] Whisper warmup failed: ${response.status}`);
+        return;
+      }
+
+      this.models.markVerified(this.config.whisperModel);
+      console.log(
+        `[LocalAI] Whisper model '${this.config.whisperModel}' warmed up (${Date.now() - startTime}ms)`
+      );
+    } catch (err) {
+      console.warn("[LocalAI] Whisper warmup failed:", err);
     } finally {
       clearTimeout(timeoutId);
     }
@@ -230,6 +359,10 @@ class LocalAIService implements InferenceProvider {
         tokensUsed: rawResponse.usage?.total_tokens || 0,
         rawResponse,
       };
+    } catch (error) {
+      // Force a fresh model check on the next job
+      this.models.evict(this.config.llmModel);
+      throw error;
     } finally {
       clearTimeout(timeoutId);
     }
@@ -301,6 +434,8 @@ class LocalAIService implements InferenceProvider {
         const response = await fetch(`${this.config.baseUrl}/readyz`, {
           signal: controller.signal,
         });
+        // Drain the body so undici can return the keep-alive socket to its pool
+        await response.arrayBuffer();
         return response.ok;
       } finally {
         clearTimeout(timeoutId);
@@ -326,6 +461,7 @@ class LocalAIService implements InferenceProvider {
         });
 
         if (!response.ok) {
+          await response.arrayBuffer();
           return false;
         }
 
@@ -345,6 +481,24 @@ class LocalAIService implements InferenceProvider {
     }
   }
 
+  /**
+   * Check a model is loaded, reusing a recent positive result if one exists.
+   * Use this on the job path; isModelLoaded() always hits the server.
+   */
+  async ensureModelLoaded(modelName: string): Promise<boolean> {
+    if (this.models.isVerified(modelName)) {
+      return true;
+    }
+
+    const loaded = await this.isModelLoaded(modelName);
+    if (loaded) {
+      this.models.markVerified(modelName);
+    } else {
+      this.models.evict(modelName);
+    }
+    return loaded;
+  }
+
   /**
    * Verify both models (whisper + LLM) are loaded before processing
    * Returns { loaded: boolean, missing: string[] }
@@ -377,7 +531,7 @@ class LocalAIService implements InferenceProvider {
     const startTime = Date.now();
 
     // First verify the model is loaded
-    const llmLoaded = await this.isModelLoaded(this.config.llmModel);
+    const llmLoaded = await this.ensureModelLoaded(this.config.llmModel);
     if (!llmLoaded) {
       throw new Error(
         `Model '${this.config.llmModel}' is not loaded. ` +
@@ -423,19 +577,25 @@ class LocalAIService implements InferenceProvider {
       }
 
       const decoder = new TextDecoder();
+      const jsonTracker = new JsonCompletionTracker();
+      let pending = ""; // Partial SSE line carried over between reads
       let fullText = "";
       let tokenCount = 0;
       let lastChunkTime = Date.now();
+      let analysisComplete = false;
 
-      while (true) {
+      while (!analysisComplete) {
         const { done, value } = await reader.read();
 
         if (done) break;
 
-        const chunk = decoder.decode(value, { stream: true });
-        const lines = chunk.split("\n").filter((line) => line.trim() !== "");
+        pending += decoder.decode(value, { stream: true });
+        const lines = pending.split("\n");
+        pending = lines.pop() ?? "";
 
         for (const line of lines) {
+          if (analysisComplete) break;
+
           if (line.startsWith("data: ")) {
             const data = line.slice(6);
 
@@ -459,6 +619,8 @@ class LocalAIService implements InferenceProvider {
                 if (onHeartbeat) {
                   onHeartbeat(tokenCount, fullText);
                 }
+
+                analysisComplete = jsonTracker.push(content);
               }
             } catch (parseErr) {
               // Log malformed JSON chunks for debugging (at debug level to avoid noise)
@@ -469,6 +631,8 @@ class LocalAIService implements InferenceProvider {
 
         // Check for stuck streaming (no tokens in 30 seconds)
         if (Date.now() - lastChunkTime > 30000) {
+          // Release the connection now rather than when the stream is GC'd
+          await reader.cancel();
           throw new Error(
             `Streaming stalled: no tokens received for 30 seconds. ` +
             `Received ${tokenCount} tokens before stall.`
@@ -476,6 +640,12 @@ class LocalAIService implements InferenceProvider {
         }
       }
 
+      if (analysisComplete) {
+        // The analysis object is closed; anything after it is discarded by
+        // extractJson anyway, so stop generation instead of waiting for EOS
+        await reader.cancel();
+      }
+
       // Parse the accumulated response
       const analysis = this.parseAnalysisResponse(fullText);
 
@@ -503,6 +673,10 @@ class LocalAIService implements InferenceProvider {
         processingTimeMs: Date.now() - startTime,
         rawResponse: { streamed: true, tokenCount, parseError: true },
       };
+    } catch (error) {
+      // Force a fresh model check on the next job
+      this.models.evict(this.config.llmModel);
+      throw error;
     } finally {
       clearTimeout(timeoutId);
     }
@@ -15,6 +15,13 @@ import { randomUUID } from "crypto";
 import { DeepgramStream, TranscriptSegment, UtteranceEndEvent } from "./deepgram-stream.js";
 import { inferenceQueue } from "./inference-queue.js";
 import { jobEventHub } from "./job-event-hub.js";
+import {
+  WAV_SAMPLE_RATE,
+  WAV_BITS_PER_SAMPLE,
+  WAV_NUM_CHANNELS,
+  WAV_HEADER_SIZE,
+  createWavHeader,
+} from "../utils/wav.js";
 
 // Message types from clients
 interface ControlMessage {
@@ -108,42 +115,6 @@ const MIN_WORDS_FOR_ANALYSIS = 0;
 // Uploads directory path
 const UPLOADS_DIR = path.join(process.cwd(), "uploads");
 
-// WAV file constants (16-bit PCM, 16kHz, mono)
-const WAV_SAMPLE_RATE = 16000;
-const WAV_BITS_PER_SAMPLE = 16;
-const WAV_NUM_CHANNELS = 1;
-const WAV_HEADER_SIZE = 44;
-
-/**
- * Create a WAV file header for PCM audio data
- */
-function createWavHeader(dataSize: number): Buffer {
-  const header = Buffer.alloc(WAV_HEADER_SIZE);
-  const byteRate = WAV_SAMPLE_RATE * WAV_NUM_CHANNELS * (WAV_BITS_PER_SAMPLE / 8);
-  const blockAlign = WAV_NUM_CHANNELS * (WAV_BITS_PER_SAMPLE / 8);
-
-  // RIFF chunk descriptor
-  header.write("RIFF", 0);
-  header.writeUInt32LE(36 + dataSize, 4); // File size - 8
-  header.write("WAVE", 8);
-
-  // fmt sub-chunk
-  header.write("fmt ", 12);
-  header.writeUInt32LE(16, 16); // Subchunk1Size (16 for PCM)
-  header.writeUInt16LE(1, 20); // AudioFormat (1 = PCM)
-  header.writeUInt16LE(WAV_NUM_CHANNELS, 22);
-  header.writeUInt32LE(WAV_SAMPLE_RATE, 24);
-  header.writeUInt32LE(byteRate, 28);
-  header.writeUInt16LE(blockAlign, 32);
-  header.writeUInt16LE(WAV_BITS_PER_SAMPLE, 34);
-
-  // data sub-chunk
-  header.write("data", 36);
-  header.writeUInt32LE(dataSize, 40);
-
-  return header;
-}
-
 export class StreamHub {
   private broadcaster: WebSocket | null = null;
   private broadcasterAuthenticated = false;
@@ -59,17 +59,15 @@ export interface ChunkWithAnalysis extends StreamChunk {
 }
 
 export class StreamService {
-  private getDb(): Database.Database {
-    return database.getConnection();
+  private prepare(sql: string): Database.Statement {
+    return database.prepare(sql);
   }
 
   /**
    * Create a new stream session linked to an audio submission
    */
   createStreamSession(params: CreateStreamSessionParams): StreamSession {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO stream_sessions (id, submission_id, title)
       VALUES (?, ?, ?)
     `);
@@ -83,8 +81,7 @@ export class StreamService {
    * Get a stream session by ID
    */
   getStreamSession(sessionId: string): StreamSession | null {
-    const db = this.getDb();
-    const stmt = db.prepare("SELECT * FROM stream_sessions WHERE id = ?");
+    const stmt = this.prepare("SELECT * FROM stream_sessions WHERE id = ?");
     return stmt.get(sessionId) as StreamSession | null;
   }
 
@@ -92,8 +89,7 @@ export class StreamService {
    * Get stream session by submission ID
    */
   getStreamSessionBySubmission(submissionId: string): StreamSession | null {
-    const db = this.getDb();
-    const stmt = db.prepare("SELECT * FROM stream_sessions WHERE submission_id = ?");
+    const stmt = this.prepare("SELECT * FROM stream_sessions WHERE submission_id = ?");
     return stmt.get(submissionId) as StreamSession | null;
   }
 
@@ -102,8 +98,7 @@ export class StreamService {
    * Returns the most recently started session that has chunks
    */
   getMostRecentSession(): StreamSession | null {
-    const db = this.getDb();
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       SELECT s.* FROM stream_sessions s
       WHERE EXISTS (SELECT 1 FROM stream_chunks c WHERE c.session_id = s.id)
       ORDER BY s.started_at DESC
@@ -117,8 +112,7 @@ export class StreamService {
    * Used to replay full transcript history to viewers
    */
   getAllChunks(): StreamChunk[] {
-    const db = this.getDb();
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       SELECT * FROM stream_chunks
       ORDER BY created_at ASC
     `);
@@ -137,8 +131,6 @@ export class StreamService {
       chunkCount?: number;
     }
   ): void {
-    const db = this.getDb();
-
     const setClauses: string[] = [];
     const params: (string | number)[] = [];
 
@@ -163,20 +155,18 @@ export class StreamService {
 
     params.push(sessionId);
     const sql = `UPDATE stream_sessions SET ${setClauses.join(", ")} WHERE id = ?`;
-    db.prepare(sql).run(...params);
+    this.prepare(sql).run(...params);
   }
 
   /**
    * End a stream session
    */
   endStreamSession(sessionId: string, totalDurationMs: number): void {
-    const db = this.getDb();
-
-    const countResult = db.prepare(
+    const countResult = this.prepare(
       "SELECT COUNT(*) as count FROM stream_chunks WHERE session_id = ?"
     ).get(sessionId) as { count: number };
 
-    db.prepare(`
+    this.prepare(`
       UPDATE stream_sessions
       SET status = 'ended',
           ended_at = datetime('now'),
@@ -190,9 +180,7 @@ export class StreamService {
    * Create a new stream chunk
    */
   createStreamChunk(params: CreateStreamChunkParams): StreamChunk {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO stream_chunks
       (session_id, chunk_index, speaker, transcript, confidence, start_time_ms, end_time_ms, word_count)
       VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -216,8 +204,7 @@ export class StreamService {
    * Get a stream chunk by ID
    */
   getStreamChunk(chunkId: number): StreamChunk | null {
-    const db = this.getDb();
-    const stmt = db.prepare("SELECT * FROM stream_chunks WHERE id = ?");
+    const stmt = this.prepare("SELECT * FROM stream_chunks WHERE id = ?");
     return stmt.get(chunkId) as StreamChunk | null;
   }
 
@@ -225,8 +212,7 @@ export class StreamService {
    * Get all chunks for a session, ordered by index
    */
   getSessionChunks(sessionId: string): StreamChunk[] {
-    const db = this.getDb();
-    const stmt = db.prepare(
+    const stmt = this.prepare(
       "SELECT * FROM stream_chunks WHERE session_id = ? ORDER BY chunk_index ASC"
     );
     return stmt.all(sessionId) as StreamChunk[];
@@ -236,8 +222,7 @@ export class StreamService {
    * Get chunks that need analysis
    */
   getChunksNeedingAnalysis(sessionId: string): StreamChunk[] {
-    const db = this.getDb();
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       SELECT * FROM stream_chunks
       WHERE session_id = ? AND analysis_job_id IS NULL
       ORDER BY chunk_index ASC
@@ -249,8 +234,7 @@ export class StreamService {
    * Set the analysis job ID for a chunk
    */
   setChunkAnalysisJob(chunkId: number, jobId: number): void {
-    const db = this.getDb();
-    db.prepare("UPDATE stream_chunks SET analysis_job_id = ? WHERE id = ?").run(
+    this.prepare("UPDATE stream_chunks SET analysis_job_id = ? WHERE id = ?").run(
       jobId,
       chunkId
     );
@@ -261,9 +245,7 @@ export class StreamService {
    * Used to replay full transcript history to viewers
    */
   getAllChunksWithAnalysis(): ChunkWithAnalysis[] {
-    const db = this.getDb();
-
-    const rows = db.prepare(`
+    const rows = this.prepare(`
       SELECT
         c.id, c.session_id, c.chunk_index, c.speaker, c.transcript,
         c.confidence, c.start_time_ms, c.end_time_ms, c.word_count,
@@ -318,9 +300,7 @@ export class StreamService {
    * Get all chunks for a session with their analysis jobs (single efficient query)
    */
   getSessionChunksWithAnalysis(sessionId: string): ChunkWithAnalysis[] {
-    const db = this.getDb();
-
-    const rows = db.prepare(`
+    const rows = this.prepare(`
       SELECT
         c.id, c.session_id, c.chunk_index, c.speaker, c.transcript,
         c.confidence, c.start_time_ms, c.end_time_ms, c.word_count,
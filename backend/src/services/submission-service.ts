@@ -41,17 +41,15 @@ export interface CreateSubmissionParams {
 }
 
 export class SubmissionService {
-  private getDb(): Database.Database {
-    return database.getConnection();
+  private prepare(sql: string): Database.Statement {
+    return database.prepare(sql);
   }
 
   /**
    * Create a new audio submission (without auto-processing - use InferenceQueueService for that)
    */
   createSubmission(params: CreateSubmissionParams): AudioSubmission {
-    const db = this.getDb();
-
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       INSERT INTO audio_submissions
       (id, filename, file_path, original_filename, mime_type, file_size, duration_seconds, metadata)
       VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -75,8 +73,7 @@ export class SubmissionService {
    * Get an audio submission by ID
    */
   getSubmission(submissionId: string): AudioSubmission | null {
-    const db = this.getDb();
-    const stmt = db.prepare("SELECT * FROM audio_submissions WHERE id = ?");
+    const stmt = this.prepare("SELECT * FROM audio_submissions WHERE id = ?");
     return stmt.get(submissionId) as AudioSubmission | null;
   }
 
@@ -84,8 +81,7 @@ export class SubmissionService {
    * Get all audio submissions (with pagination)
    */
   getSubmissions(limit: number = 50, offset: number = 0): AudioSubmission[] {
-    const db = this.getDb();
-    const stmt = db.prepare(
+    const stmt = this.prepare(
       "SELECT * FROM audio_submissions ORDER BY created_at DESC LIMIT ? OFFSET ?"
     );
     return stmt.all(limit, offset) as AudioSubmission[];
@@ -95,8 +91,7 @@ export class SubmissionService {
    * Get submissions by status
    */
   getSubmissionsByStatus(status: SubmissionStatus): AudioSubmission[] {
-    const db = this.getDb();
-    const stmt = db.prepare(
+    const stmt = this.prepare(
       "SELECT * FROM audio_submissions WHERE status = ? ORDER BY created_at DESC"
     );
     return stmt.all(status) as AudioSubmission[];
@@ -110,17 +105,15 @@ export class SubmissionService {
     status: SubmissionStatus,
     errorMessage?: string
   ): void {
-    const db = this.getDb();
-
     if (errorMessage) {
-      const stmt = db.prepare(`
+      const stmt = this.prepare(`
         UPDATE audio_submissions
         SET status = ?, error_message = ?, updated_at = datetime('now')
         WHERE id = ?
       `);
       stmt.run(status, errorMessage, submissionId);
     } else {
-      const stmt = db.prepare(`
+      const stmt = this.prepare(`
         UPDATE audio_submissions
         SET status = ?, updated_at = datetime('now')
         WHERE id = ?
@@ -138,8 +131,6 @@ export class SubmissionService {
     limit?: number;
     offset?: number;
   }): { submissions: AudioSubmission[]; total: number } {
-    const db = this.getDb();
-
     const conditions: string[] = [];
     const params: (number | string)[] = [];
 
@@ -154,13 +145,13 @@ export class SubmissionService {
 
     const whereClause = conditions.length > 0 ? `WHERE ${conditions.join(" AND ")}` : "";
 
-    const countStmt = db.prepare(`SELECT COUNT(*) as total FROM audio_submissions ${whereClause}`);
+    const countStmt = this.prepare(`SELECT COUNT(*) as total FROM audio_submissions ${whereClause}`);
     const countResult = countStmt.get(...params) as { total: number };
 
     const limit = query.limit || 100;
     const offset = query.offset || 0;
 
-    const dataStmt = db.prepare(`
+    const dataStmt = this.prepare(`
       SELECT * FROM audio_submissions
       ${whereClause}
       ORDER BY created_at DESC
@@ -176,8 +167,7 @@ export class SubmissionService {
    * Get a submission by original filename
    */
   getSubmissionByFilename(filename: string): AudioSubmission | null {
-    const db = this.getDb();
-    const stmt = db.prepare(`
+    const stmt = this.prepare(`
       SELECT * FROM audio_submissions
       WHERE original_filename = ? OR filename = ?
       LIMIT 1
@@ -189,13 +179,11 @@ export class SubmissionService {
    * Generate a unique display name for a file
    */
   generateUniqueDisplayName(originalFilename: string): string {
-    const db = this.getDb();
-
     const lastDot = originalFilename.lastIndexOf(".");
     const baseName = lastDot > 0 ? originalFilename.slice(0, lastDot) : originalFilename;
     const extension = lastDot > 0 ? originalFilename.slice(lastDot) : "";
 
-    const exactMatch = db.prepare(
+    const exactMatch = this.prepare(
       "SELECT COUNT(*) as count FROM audio_submissions WHERE original_filename = ?"
     ).get(originalFilename) as { count: number };
 
@@ -204,7 +192,7 @@ export class SubmissionService {
     }
 
     const pattern = `${baseName}_%`;
-    const existingCount = db.prepare(`
+    const existingCount = this.prepare(`
       SELECT COUNT(*) as count FROM audio_submissions
       WHERE original_filename = ? OR original_filename LIKE ?
     `).get(originalFilename, pattern + extension) as { count: number };
@@ -217,14 +205,12 @@ export class SubmissionService {
    * Note: Associated jobs should be deleted separately
    */
   deleteSubmission(submissionId: string): boolean {
-    const db = this.getDb();
-
     const submission = this.getSubmission(submissionId);
     if (!submission) {
       return false;
     }
 
-    const result = db.prepare("DELETE FROM audio_submissions WHERE id = ?").run(submissionId);
+    const result = this.prepare("DELETE FROM audio_submissions WHERE id = ?").run(submissionId);
 
     if (submission.file_path && fs.existsSync(submission.file_path)) {
       try {
@@ -245,9 +231,7 @@ export class SubmissionService {
     fileSize: number,
     durationSeconds: number
   ): void {
-    const db = this.getDb();
-
-    db.prepare(`
+    this.prepare(`
       UPDATE audio_submissions
       SET file_size = ?,
           duration_seconds = ?,
@@ -19,6 +19,7 @@ export interface TranscriptionResult {
   model: string;
   processingTimeMs: number;
   rawResponse: unknown;
+  rawResponseJson?: string; // rawResponse as received, when the provider kept the body
 }
 
 /**
@@ -0,0 +1,51 @@
+/**
+ * WAV helpers
+ *
+ * Shared by the stream recorder (which writes 16kHz mono PCM to disk)
+ * and the LocalAI warmup request.
+ */
+
+// WAV file constants (16-bit PCM, 16kHz, mono)
+export const WAV_SAMPLE_RATE = 16000;
+export const WAV_BITS_PER_SAMPLE = 16;
+export const WAV_NUM_CHANNELS = 1;
+export const WAV_HEADER_SIZE = 44;
+
+/**
+ * Create a WAV file header for PCM audio data
+ */
+export function createWavHeader(dataSize: number): Buffer {
+  const header = Buffer.alloc(WAV_HEADER_SIZE);
+  const byteRate = WAV_SAMPLE_RATE * WAV_NUM_CHANNELS * (WAV_BITS_PER_SAMPLE / 8);
+  const blockAlign = WAV_NUM_CHANNELS * (WAV_BITS_PER_SAMPLE / 8);
+
+  // RIFF chunk descriptor
+  header.write("RIFF", 0);
+  header.writeUInt32LE(36 + dataSize, 4); // File size - 8
+  header.write("WAVE", 8);
+
+  // fmt sub-chunk
+  header.write("fmt ", 12);
+  header.writeUInt32LE(16, 16); // Subchunk1Size (16 for PCM)
+  header.writeUInt16LE(1, 20); // AudioFormat (1 = PCM)
+  header.writeUInt16LE(WAV_NUM_CHANNELS, 22);
+  header.writeUInt32LE(WAV_SAMPLE_RATE, 24);
+  header.writeUInt32LE(byteRate, 28);
+  header.writeUInt16LE(blockAlign, 32);
+  header.writeUInt16LE(WAV_BITS_PER_SAMPLE, 34);
+
+  // data sub-chunk
+  header.write("data", 36);
+  header.writeUInt32LE(dataSize, 40);
+
+  return header;
+}
+
+/**
+ * Create an in-memory WAV file of digital silence
+ */
+export function createSilentWav(durationMs: number): Buffer {
+  const sampleCount = Math.round((WAV_SAMPLE_RATE * durationMs) / 1000);
+  const dataSize = sampleCount * WAV_NUM_CHANNELS * (WAV_BITS_PER_SAMPLE / 8);
+  return Buffer.concat([createWavHeader(dataSize), Buffer.alloc(dataSize)]);
+}